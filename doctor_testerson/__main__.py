@@ -1,10 +1,10 @@
+from heapq import heappop, heappush
 import sys
 import logging
 
 from .parser import get_args
 from .project import iter_all_files
-from .testing import test_targets, has_errors
-from .output import print_header_panel, print_results, ERR
+from .testing import Result, iter_test_targets
 
 _LOG = logging.getLogger(__package__)
 
@@ -14,6 +14,10 @@ def main(argv: list[str] = sys.argv):
 
     args = get_args(argv)
 
+    # Rich is a hefty import; don't pay for it until the arguments have parsed
+    # (no need for `--help` or a usage error)
+    from .output import print_header_panel, print_results, ERR
+
     if args.all:
         if args.targets:
             _LOG.warning("TARGETS ignored with --all")
@@ -22,13 +26,19 @@ def main(argv: list[str] = sys.argv):
     if args.panel is True:
         print_header_panel(args)
 
-    results = test_targets(args)
-    had_errors = has_errors(results)
+    # Results arrive as the workers finish them; heap them up by name as they
+    # come so they're ready to pop off in display order
+    heap: list[tuple[str, int, Result]] = []
+    had_errors = False
+
+    for index, result in iter_test_targets(args):
+        heappush(heap, (result.name, index, result))
+        had_errors = had_errors or result.tests.failed > 0
 
     if args.fail_fast is True and had_errors:
         ERR.print("[red]Failed... FAST. 🏎 🏎[/]")
     else:
-        print_results(results)
+        print_results(heappop(heap)[-1] for _ in range(len(heap)))
 
     sys.exit(1 if had_errors else 0)
 
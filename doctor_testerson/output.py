@@ -1,6 +1,8 @@
 from argparse import Namespace
+from functools import lru_cache
+import os
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 import sys
 
 from rich.text import Text
@@ -12,33 +14,76 @@ from rich.tree import Tree
 from rich.box import HEAVY
 from rich.padding import Padding
 
-from pint import Quantity
+from .testing import Result
 
-from .testing import Result, U
+# Created on first use by `get_unit_registry` — loading pint's unit
+# definitions is slow, and only needed to format unusual units
+_UNIT_REGISTRY = None
+
+# Nanoseconds per unit and the symbol to show, for the units `format_delta_t`
+# handles itself
+DELTA_T_UNITS = {
+    "ns": (1, "ns"),
+    "us": (1_000, "µs"),
+    "µs": (1_000, "µs"),
+    "ms": (1_000_000, "ms"),
+    "s": (1_000_000_000, "s"),
+}
 
 OUT = Console(file=sys.stdout)
 ERR = Console(file=sys.stderr)
 
+# Built once here rather than parsed from style strings on every `percent`
+# call
+PERCENT_OK_STYLE = Style(color="green", bold=True)
+PERCENT_BAD_STYLE = Style(color="red", bold=True)
+PERCENT_NONE = Text("-", style=Style(color="bright_black"))
+
+
+@lru_cache(maxsize=128)
+def _percent_text(number: int) -> Text:
+    # Shared between every cell showing the same percentage — fine as long
+    # as nothing modifies the `Text` once it's been handed out
+    return Text(
+        f"{number}%",
+        style=PERCENT_OK_STYLE if number == 100 else PERCENT_BAD_STYLE,
+    )
+
 
 def percent(numerator: float, denominator: float) -> Text:
     if denominator == 0:
-        return Text("-", style="bright black")
+        return PERCENT_NONE
+
+    return _percent_text(round(numerator * 100 / denominator))
+
 
-    number = round((numerator / denominator) * 100)
+def get_unit_registry():
+    global _UNIT_REGISTRY
 
-    string = f"{number}%"
+    if _UNIT_REGISTRY is None:
+        from pint import UnitRegistry
 
-    if number == 100:
-        return Text(string, style="bold green")
-    return Text(string, style="bold red")
+        _UNIT_REGISTRY = UnitRegistry()
 
+    return _UNIT_REGISTRY
 
-def format_delta_t(delta_t: Quantity, units: Any = "ms") -> str:
-    return f"{delta_t.to(units):.2f~P}"
+
+def format_delta_t(delta_t_ns: int, units: Any = "ms") -> str:
+    """
+    Format a nanosecond duration like `1.23 ms`. Units outside of
+    `DELTA_T_UNITS` are handed off to pint.
+    """
+    if units in DELTA_T_UNITS:
+        scale, symbol = DELTA_T_UNITS[units]
+        return f"{delta_t_ns / scale:.2f} {symbol}"
+
+    Qty = get_unit_registry().Quantity
+    return f"{Qty(delta_t_ns, 'ns').to(units):.2f~P}"
 
 
 def print_header_panel(args: Namespace) -> None:
     cwd = Path.cwd()
+    cwd_prefix = os.path.join(cwd, "")
     tree = Tree(
         Text(
             "Dr. T! These files need your help!",
@@ -57,11 +102,20 @@ def print_header_panel(args: Namespace) -> None:
         )
     else:
         for target in args.targets:
-            try:
-                item = Path(target).relative_to(cwd)
-            except ValueError:
-                item = target
-            tree.add(Text(str(item), style=Style(color="black")))
+            item = os.fspath(target)
+
+            # Relative targets are left as-is and absolute ones under the
+            # working directory are trimmed with a plain prefix check; only
+            # anything else needs `Path.relative_to` to have a go
+            if item.startswith(cwd_prefix):
+                item = item[len(cwd_prefix) :]
+            elif os.path.isabs(item):
+                try:
+                    item = str(Path(item).relative_to(cwd))
+                except ValueError:
+                    pass
+
+            tree.add(Text(item, style=Style(color="black")))
 
     OUT.print(
         Padding(
@@ -80,7 +134,11 @@ def print_header_panel(args: Namespace) -> None:
     )
 
 
-def print_results(results: list[Result]) -> None:
+def print_results(results: Iterable[Result]) -> None:
+    """
+    Print a table of `results`, one row each in the order given, with the
+    totals at the bottom.
+    """
     table = Table(title="Doctest Results")
     table.expand = True
 
@@ -90,36 +148,35 @@ def print_results(results: list[Result]) -> None:
     table.add_column(Text("failed", style="bold red"), justify="right")
     table.add_column("%", justify="right")
 
-    for result in sorted(results, key=lambda r: r.name):
+    total_delta_t_ns: int = 0
+    total_attempted: int = 0
+    total_passed: int = 0
+    total_failed: int = 0
+
+    for result in results:
+        tests = result.tests
+        tests_passed = result.tests_passed
+
         table.add_row(
             result.name,
-            format_delta_t(result.delta_t),
-            str(result.tests_passed),
-            str(result.tests.failed),
-            percent(
-                result.tests_passed,
-                result.tests.attempted,
-            ),
+            format_delta_t(result.delta_t_ns),
+            str(tests_passed),
+            str(tests.failed),
+            percent(tests_passed, tests.attempted),
         )
 
+        total_delta_t_ns += result.delta_t_ns
+        total_attempted += tests.attempted
+        total_passed += tests_passed
+        total_failed += tests.failed
+
     # Add an empty row at the bottom with a line under it visually separate
     # the summary row
     table.add_row(None, None, None, None, None, end_section=True)
 
-    total_delta_t = 0 * U.ms
-    total_attempted: int = 0
-    total_passed: int = 0
-    total_failed: int = 0
-
-    for result in results:
-        total_delta_t += result.delta_t
-        total_attempted += result.tests.attempted
-        total_passed += result.tests_passed
-        total_failed += result.tests.failed
-
     table.add_row(
         "[bold]Total[/]",
-        format_delta_t(total_delta_t),
+        format_delta_t(total_delta_t_ns),
         str(total_passed),
         str(total_failed),
         percent(
@@ -1,8 +1,15 @@
 from argparse import ArgumentParser, Namespace
+from functools import cache
 from pathlib import Path
 
 
-def build_parser():
+@cache
+def build_parser() -> ArgumentParser:
+    """
+    Built once and shared — parsing doesn't modify the parser, so repeat
+    `get_args` calls (when `main` is driven as a library) can all use the
+    same one. See `reset_parser_cache` to force a rebuild.
+    """
     parser = ArgumentParser(prog="doctest", description="Doctest driver")
     parser.add_argument(
         "-v",
@@ -51,11 +58,17 @@ def build_parser():
         "targets",
         type=Path,
         nargs="*",
-        default=[],
+        # Immutable, as the (cached) parser hands this same object to every
+        # parse that doesn't give any targets
+        default=(),
         help="Specific module names or file paths to run",
     )
     return parser
 
 
+def reset_parser_cache() -> None:
+    build_parser.cache_clear()
+
+
 def get_args(argv: list[str]) -> Namespace:
     return build_parser().parse_args(argv[1:])
@@ -1,3 +1,5 @@
+from functools import lru_cache
+import os
 from pathlib import Path
 from typing import Generator, Iterable, Literal
 import tomli
@@ -58,14 +60,29 @@ def iter_all_files() -> Iterable[Path]:
     yield from iter_doc_files()
 
 
+@lru_cache(maxsize=None)
+def _file_names(dir: Path) -> frozenset[str]:
+    """
+    Names of the files directly in `dir`, from a single read of the directory
+    — the package root checks below all answer from this rather than a `stat`
+    per file.
+    """
+    try:
+        with os.scandir(dir) as entries:
+            return frozenset(
+                entry.name for entry in entries if entry.is_file()
+            )
+    except OSError:
+        return frozenset()
+
+
 def is_poetry_root(dir: Path) -> bool:
-    return (dir / POETRY_FILENAME).is_file()
+    return POETRY_FILENAME in _file_names(dir)
 
 
 def is_setup_py_root(dir: Path) -> bool:
-    return (dir / SETUP_FILENAME).is_file() and not (
-        dir / "__init__.py"
-    ).is_file()
+    names = _file_names(dir)
+    return SETUP_FILENAME in names and "__init__.py" not in names
 
 
 def is_package_root(dir: Path) -> bool:
@@ -73,10 +90,15 @@ def is_package_root(dir: Path) -> bool:
 
 
 def to_module_name(file_path: Path) -> str:
+    # Resolve before hitting the cache so that the different ways of spelling
+    # a path all share an entry
+    return _to_module_name(file_path.resolve())
+
+
+@lru_cache(maxsize=None)
+def _to_module_name(file_path: Path) -> str:
     dir = file_path.parent
-    while True:
-        if is_package_root(dir):
-            break
+    while not is_package_root(dir):
         if dir.parent == dir:
             raise Exception(
                 f"Failed to find poetry file {POETRY_FILENAME} in "
@@ -88,9 +110,14 @@ def to_module_name(file_path: Path) -> str:
     return ".".join((rel_path.parent / rel_path.stem).parts)
 
 
+@lru_cache(maxsize=None)
 def resolve_target(
     target: str,
 ) -> tuple[Literal["module"], str] | tuple[Literal["text_file"], Path]:
+    """
+    Cached, so relative `target` paths are resolved against the working
+    directory at the time of the _first_ call.
+    """
     path = Path(target).resolve()
 
     if not path.exists():
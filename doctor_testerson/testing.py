@@ -1,84 +1,298 @@
 from argparse import Namespace
-from functools import cached_property
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+import os
 from pathlib import Path
+import sys
 import doctest
 from importlib import import_module
-from dataclasses import dataclass
+from multiprocessing import get_all_start_methods, get_context
+from dataclasses import dataclass, field
 from time import monotonic_ns
 from types import ModuleType
-
-from pint import UnitRegistry, Quantity
-
-U = UnitRegistry()
+from typing import Any, Iterable, Iterator
 
 from .project import resolve_target
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class ModuleResult:
     target: str
     module_name: str
-    module: ModuleType
-    delta_t: Quantity
+    delta_t_ns: int
     tests: doctest.TestResults
+    name: str = field(init=False)
+    tests_passed: int = field(init=False)
 
-    @cached_property
-    def name(self) -> str:
-        return self.module_name
-
-    @cached_property
-    def tests_passed(self) -> int:
-        return self.tests.attempted - self.tests.failed
+    def __post_init__(self) -> None:
+        self.name = self.module_name
+        self.tests_passed = self.tests.attempted - self.tests.failed
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class TextFileResult:
     target: str
     file_path: Path
-    delta_t: Quantity
+    delta_t_ns: int
     tests: doctest.TestResults
+    name: str = field(init=False)
+    tests_passed: int = field(init=False)
 
-    @cached_property
-    def name(self) -> str:
-        return str(self.file_path)
-
-    @cached_property
-    def tests_passed(self) -> int:
-        return self.tests.attempted - self.tests.failed
+    def __post_init__(self) -> None:
+        self.name = str(self.file_path)
+        self.tests_passed = self.tests.attempted - self.tests.failed
 
 
 Result = ModuleResult | TextFileResult
 
+DEFAULT_OPTION_FLAGS = doctest.NORMALIZE_WHITESPACE | doctest.ELLIPSIS
+
 
-def now() -> Quantity:
-    return monotonic_ns() * U.ns
+def now() -> int:
+    return monotonic_ns()
 
 
 def has_errors(results: list[Result]) -> bool:
     return any(result.tests.failed > 0 for result in results)
 
 
+def _cached_import(module_name: str) -> ModuleType:
+    """
+    Like `importlib.import_module`, but peeks in `sys.modules` first so
+    already-loaded modules skip the import machinery (and its lock).
+
+    Modules that are still initializing — mid-import on another thread — go
+    through `import_module` as well, which waits for them to finish.
+    """
+    modules = sys.modules
+    if module_name not in modules or (
+        getattr(modules[module_name], "__spec__", None) is not None
+        and getattr(modules[module_name].__spec__, "_initializing", False)
+    ):
+        import_module(module_name)
+    return modules[module_name]
+
+
+def _worker_init(module_names: Iterable[str]) -> None:
+    """
+    Process pool initializer — imports `module_names` into the fresh worker
+    so targets that share them find them already in `sys.modules`.
+
+    Failures are left for the target that actually imports the module to
+    raise and report.
+    """
+    for module_name in module_names:
+        try:
+            _cached_import(module_name)
+        except Exception:
+            pass
+
+
+def max_workers() -> int:
+    """
+    How many worker processes to test targets in — all the cores, less two to
+    keep the machine responsive, but always at least one.
+    """
+    return max(1, (os.cpu_count() or 1) - 2)
+
+
 def test_targets(args: Namespace) -> list[Result]:
-    results = []
+    """
+    Test `args.targets`, returning the results in target order.
+    """
+    return [result for _, result in sorted(iter_test_targets(args))]
 
-    for target in args.targets:
-        result = test_target(target, args)
 
-        if (
-            args.empty is None
-            or (args.empty is True and result.tests.attempted == 0)
-            or (args.empty is False and result.tests.attempted != 0)
+def iter_test_targets(args: Namespace) -> Iterator[tuple[int, Result]]:
+    """
+    Test `args.targets`, yielding each result as soon as it is ready — which
+    is _not_ necessarily in target order — paired with the index of its
+    target.
+    """
+    option_flags = DEFAULT_OPTION_FLAGS | (
+        doctest.FAIL_FAST if args.fail_fast else 0
+    )
+    resolutions = [resolve_target(target) for target in args.targets]
+    workers = max_workers()
+
+    # When there are fewer modules than workers, modules with enough
+    # doctests are split into (up to this many) shards so the spare workers
+    # have something to do.
+    module_names = [name for kind, name in resolutions if kind == "module"]
+    max_shards = max(1, workers // max(1, len(module_names)))
+
+    # Warm each worker with the top-level packages of the modules under test.
+    # Workers are long-lived, so anything imported stays cached for every
+    # target they pick up after.
+    preload = sorted({name.partition(".")[0] for name in module_names})
+
+    # Workers come from a fork server (or are spawned, where there isn't
+    # one) rather than forked from this process. That means they start only
+    # as the jobs need them rather than all up front, and never inherit a
+    # lock held by some other thread of ours.
+    executor = (
+        ProcessPoolExecutor(
+            max_workers=min(workers, len(module_names) * max_shards),
+            mp_context=get_context(
+                "forkserver"
+                if "forkserver" in get_all_start_methods()
+                else "spawn"
+            ),
+            initializer=_worker_init,
+            initargs=(preload,),
+        )
+        if module_names
+        else None
+    )
+    failed_fast = False
+    finished = False
+
+    try:
+        # Module futures still out, mapped to their target index
+        pending: dict[Future, int] = {}
+        text_files = []
+
+        # Shards of each module still out, and what they've added up to so
+        # far, by target index
+        shards_left: dict[int, int] = {}
+        partials: dict[int, ModuleResult] = {}
+
+        # Each module starts with the one job, which either tests the module
+        # outright or says how many shards to split it into
+        for index, (target, (kind, payload)) in enumerate(
+            zip(args.targets, resolutions)
         ):
-            results.append(result)
+            if kind == "module":
+                future = executor.submit(
+                    test_or_shard_module,
+                    target,
+                    payload,
+                    option_flags,
+                    max_shards,
+                )
+                pending[future] = index
+            else:
+                text_files.append((index, target, payload))
+
+        for index, result in _iter_arrivals(pending, text_files, option_flags):
+            if isinstance(result, int):
+                shards_left[index] = result
+                for shard_index in range(result):
+                    future = executor.submit(
+                        test_module,
+                        args.targets[index],
+                        resolutions[index][1],
+                        option_flags,
+                        shard_index,
+                        result,
+                    )
+                    pending[future] = index
+                continue
+
+            if index in shards_left:
+                if index in partials:
+                    result = merge_module_results(partials[index], result)
+
+                partials[index] = result
+                shards_left[index] -= 1
+
+                # Hold on until the module's last shard is in — unless this
+                # one is a fail-fast failure that's going to be shown, in
+                # which case what we have will do
+                if shards_left[index] > 0 and not (
+                    args.fail_fast
+                    and result.tests.failed > 0
+                    and _is_shown(args, result)
+                ):
+                    continue
+
+            if _is_shown(args, result):
+                if args.fail_fast and result.tests.failed > 0:
+                    failed_fast = True
+
+                yield index, result
+
+                if failed_fast:
+                    return
+
+        finished = True
+    finally:
+        if executor is not None:
+            if not finished:
+                # Failed fast, errored, or the caller stopped listening —
+                # kill any workers still mid-target rather than wait them out
+                _terminate_workers(executor)
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _is_shown(args: Namespace, result: Result) -> bool:
+    """
+    Does `result` make it past the `--only-empty` / `--hide-empty` filter?
+    """
+    return (
+        args.empty is None
+        or (args.empty is True and result.tests.attempted == 0)
+        or (args.empty is False and result.tests.attempted != 0)
+    )
 
-            if args.fail_fast and result.tests.failed > 0:
-                return results
 
-    return results
+def _terminate_workers(executor: ProcessPoolExecutor) -> None:
+    # `ProcessPoolExecutor.terminate_workers` only arrived in Python 3.14;
+    # before that there's nothing for it but to reach in for the processes
+    terminate_workers = getattr(executor, "terminate_workers", None)
+    if terminate_workers is not None:
+        terminate_workers()
+        return
 
+    for process in list((executor._processes or {}).values()):
+        process.terminate()
 
-def test_target(target, args: Namespace) -> Result:
+
+def _iter_arrivals(
+    pending: dict[Future, int],
+    text_files: list[tuple[int, Any, Path]],
+    option_flags: int,
+) -> Iterator[tuple[int, Result | int]]:
+    """
+    Yield `(index, result)` pairs as they come in: from the `pending` module
+    futures, and from the `text_files`. Callers may add to `pending` as they
+    go.
+
+    Text files don't touch any module's state, so they skip the process
+    overhead and run right here on the main thread while the workers get on
+    with the modules. One at a time, too, as `DocTestRunner.run` swaps out
+    `sys.stdout` while it runs. Module results that came in meanwhile are
+    handed over between files.
+
+    A worker process that dies mid-target breaks the pool, and the
+    `BrokenProcessPool` from `Future.result` is raised from here.
     """
+    text_files = deque(text_files)
+
+    while pending or text_files:
+        done = [future for future in pending if future.done()]
+
+        if not done:
+            if text_files:
+                index, target, file_path = text_files.popleft()
+                yield index, test_text_file(target, file_path, option_flags)
+                continue
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+        for future in done:
+            yield pending.pop(future), future.result()
+
+
+def test_target(target, option_flags: int = DEFAULT_OPTION_FLAGS) -> Result:
+    """
+    Test a single `target`, right here in the current process.
+
     #### Parameters ####
 
     -   `target` — one of:
@@ -90,12 +304,9 @@ def test_target(target, args: Namespace) -> Result:
             This path may be relative to the current directory or absolute.
 
         3.  A path to a text file.
-    """
-    option_flags = doctest.NORMALIZE_WHITESPACE | doctest.ELLIPSIS
-
-    if args.fail_fast is True:
-        option_flags = option_flags | doctest.FAIL_FAST
 
+    -   `option_flags` — `doctest` option flags to run with.
+    """
     resolution = resolve_target(target)
 
     if resolution[0] == "module":
@@ -108,22 +319,102 @@ def test_target(target, args: Namespace) -> Result:
         )
 
 
-def test_module(target, module_name: str, option_flags: int) -> ModuleResult:
-    module = import_module(module_name)
+def test_module(
+    target,
+    module_name: str,
+    option_flags: int,
+    shard_index: int = 0,
+    shard_count: int = 1,
+) -> ModuleResult:
+    """
+    Run the doctests in module `module_name`.
+
+    Given a `shard_count`, runs only every `shard_count`-th doctest, starting
+    from `shard_index`, so a module's doctests can be split between worker
+    processes. Each worker finds the doctests for itself — `DocTest`
+    instances hold on to the module's globals, and don't pickle — and the
+    results are put back together with `merge_module_results`.
+    """
+    module = _cached_import(module_name)
+
+    t_start = now()
+    tests = doctest.DocTestFinder().find(module)
+    return _run_module_doctests(
+        target,
+        module_name,
+        tests[shard_index::shard_count],
+        option_flags,
+        t_start,
+    )
+
+
+def test_or_shard_module(
+    target, module_name: str, option_flags: int, max_shards: int
+) -> ModuleResult | int:
+    """
+    Test module `module_name` outright if its doctests aren't worth splitting
+    up, otherwise return how many shards to split them into — one per
+    doctest, up to `max_shards`.
+    """
+    module = _cached_import(module_name)
 
     t_start = now()
-    results = doctest.testmod(module, optionflags=option_flags)
-    delta_t = now() - t_start
+    tests = doctest.DocTestFinder().find(module)
+    shards = min(max_shards, len(tests))
+
+    if shards > 1:
+        return shards
+
+    return _run_module_doctests(
+        target, module_name, tests, option_flags, t_start
+    )
+
+
+def _run_module_doctests(
+    target,
+    module_name: str,
+    tests: list[doctest.DocTest],
+    option_flags: int,
+    t_start: int,
+) -> ModuleResult:
+    results = run_doctests(tests, option_flags)
+    delta_t_ns = now() - t_start
 
     return ModuleResult(
         target=target,
         module_name=module_name,
-        module=module,
-        delta_t=delta_t,
+        delta_t_ns=delta_t_ns,
         tests=results,
     )
 
 
+def merge_module_results(
+    result: ModuleResult, other: ModuleResult
+) -> ModuleResult:
+    """
+    Combine the results of two shards of the same module. The shards run
+    side-by-side, so the time is the slower of the two.
+    """
+    return ModuleResult(
+        target=result.target,
+        module_name=result.module_name,
+        delta_t_ns=max(result.delta_t_ns, other.delta_t_ns),
+        tests=doctest.TestResults(
+            failed=result.tests.failed + other.tests.failed,
+            attempted=result.tests.attempted + other.tests.attempted,
+        ),
+    )
+
+
+def run_doctests(
+    tests: list[doctest.DocTest], option_flags: int
+) -> doctest.TestResults:
+    runner = doctest.DocTestRunner(optionflags=option_flags)
+    for test in tests:
+        runner.run(test)
+    return runner.summarize()
+
+
 def test_text_file(
     target, file_path: Path, option_flags: int
 ) -> TextFileResult:
@@ -133,11 +424,11 @@ def test_text_file(
         optionflags=option_flags,
         module_relative=False,
     )
-    delta_t = now() - t_start
+    delta_t_ns = now() - t_start
 
     return TextFileResult(
         target=target,
         file_path=file_path,
-        delta_t=delta_t,
+        delta_t_ns=delta_t_ns,
         tests=results,
     )